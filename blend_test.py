@@ -6,33 +6,58 @@ Verifies that empirica (The Brain) and novasystem (The Body) are properly
 linked as editable dependencies from sibling directories.
 """
 
+import functools
+import importlib
+import importlib.util
 import os
+import re
 import sys
 from pathlib import Path
 
+# One alternation covers both installed-package markers in a single scan.
+_BAD_PATH_MARKER = re.compile(r"(site|dist)-packages")
+
+# __file__ never changes within a process; resolve it once at import time.
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _find_spec(name):
+    """Probe for a module without raising; caches misses across calls."""
+    try:
+        return importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+
+# Local alias so repeated runs hit a dict lookup instead of the full
+# import machinery (already-imported modules live in sys.modules).
+_MODULES = sys.modules
+
 
 def verify_working_directory():
     """Ensure script is running from _pyrite root."""
-    script_dir = Path(__file__).parent.resolve()
     expected_name = "_pyrite"
-    if script_dir.name != expected_name:
+    if _SCRIPT_DIR.name != expected_name:
         print(f"❌ ERROR: Script must be run from {expected_name} root directory")
-        print(f"   Current directory: {script_dir}")
+        print(f"   Current directory: {_SCRIPT_DIR}")
         return False
     return True
 
 
 def check_path_is_local(path_str, expected_sibling):
     """Verify path points to sibling directory, not site-packages."""
-    path = Path(path_str).resolve()
-    path_str_normalized = str(path)
+    # Both membership tests work on the raw string — no Path object, no
+    # stat.  Only normalize when the input is relative and genuinely
+    # ambiguous.
+    if not os.path.isabs(path_str):
+        path_str = os.path.abspath(path_str)
 
     # Check for site-packages (bad)
-    if "site-packages" in path_str_normalized or "dist-packages" in path_str_normalized:
+    if _BAD_PATH_MARKER.search(path_str):
         return False, "points to site-packages (not local)"
 
     # Check for expected sibling directory (good)
-    if expected_sibling in path_str_normalized:
+    if expected_sibling in path_str:
         return True, f"points to ../{expected_sibling}"
 
     # If neither, it's ambiguous
@@ -45,25 +70,33 @@ def test_import(module_name, expected_sibling, case_variations=None):
         case_variations = [module_name]
 
     for variant in case_variations:
-        try:
-            module = __import__(variant)
-            module_file = getattr(module, '__file__', None)
-
-            if module_file is None:
-                return False, f"Module {variant} imported but has no __file__ attribute", None
-
-            module_path = os.path.dirname(module_file)
-            is_local, path_status = check_path_is_local(module_path, expected_sibling)
-
-            if is_local is False:
-                return False, f"Module {variant} imported from {module_path} ({path_status})", module_path
-            elif is_local is True:
-                return True, f"Module {variant} imported from {module_path} ({path_status})", module_path
-            else:
-                return None, f"Module {variant} imported from {module_path} ({path_status})", module_path
-
-        except ImportError as e:
-            continue
+        module = _MODULES.get(variant)
+        if module is None:
+            # find_spec returns None on a miss instead of paying for an
+            # ImportError + traceback per failed variant.
+            if _find_spec(variant) is None:
+                continue
+            try:
+                module = importlib.import_module(variant)
+            except ImportError:
+                continue
+
+        module_file = getattr(module, '__file__', None)
+
+        if module_file is None:
+            return False, f"Module {variant} imported but has no __file__ attribute", None
+
+        # Validate on the raw __file__ string; dirname only matters for
+        # the human-readable report.
+        is_local, path_status = check_path_is_local(module_file, expected_sibling)
+        module_path = os.path.dirname(module_file)
+
+        if is_local is False:
+            return False, f"Module {variant} imported from {module_path} ({path_status})", module_path
+        elif is_local is True:
+            return True, f"Module {variant} imported from {module_path} ({path_status})", module_path
+        else:
+            return None, f"Module {variant} imported from {module_path} ({path_status})", module_path
 
     return False, f"Failed to import {module_name} (tried: {', '.join(case_variations)})", None
 
@@ -79,68 +112,59 @@ def main():
     if not verify_working_directory():
         sys.exit(1)
 
-    print("✅ Working directory: OK (running from _pyrite root)")
-    print()
-
-    # Test imports
-    results = {}
-
-    # Test empirica (The Brain)
-    print("Testing empirica (The Brain)...")
-    success, message, path = test_import(
-        "empirica",
-        "empirica",
-        case_variations=["empirica", "Empirica"]
-    )
-    results["empirica"] = (success, message, path)
-    if success:
-        print(f"  ✅ {message}")
-    else:
-        print(f"  ❌ {message}")
-    print()
-
-    # Test novasystem (The Body)
-    print("Testing novasystem (The Body)...")
-    success, message, path = test_import(
-        "novasystem",
-        "NovaSystem-Codex",
-        case_variations=["novasystem", "NovaSystem"]
-    )
-    results["novasystem"] = (success, message, path)
-    if success:
-        print(f"  ✅ {message}")
-    else:
-        print(f"  ❌ {message}")
-    print()
-
-    # Final report
-    print("=" * 70)
-    print("VERIFICATION REPORT")
-    print("=" * 70)
-    print()
-
-    all_success = all(result[0] for result in results.values())
+    # Run both import tests up front; the whole report is then assembled
+    # into one buffer and written with a single stdout call instead of a
+    # dozen individually-flushed print()s.
+    results = [
+        ("empirica", "The Brain", test_import(
+            "empirica",
+            "empirica",
+            case_variations=["empirica", "Empirica"]
+        )),
+        ("novasystem", "The Body", test_import(
+            "novasystem",
+            "NovaSystem-Codex",
+            case_variations=["novasystem", "NovaSystem"]
+        )),
+    ]
+
+    all_success = all(result[0] for _, _, result in results)
+
+    lines = ["✅ Working directory: OK (running from _pyrite root)", ""]
+
+    for name, role, (success, message, _) in results:
+        lines.append(f"Testing {name} ({role})...")
+        lines.append(f"  {'✅' if success else '❌'} {message}")
+        lines.append("")
+
+    lines.append("=" * 70)
+    lines.append("VERIFICATION REPORT")
+    lines.append("=" * 70)
+    lines.append("")
 
     if all_success:
-        print("🟢 GREEN LIGHTS - All imports successful from local paths!")
-        print()
-        print("Package Locations:")
-        for name, (success, message, path) in results.items():
-            if path:
-                print(f"  • {name}: {path}")
-        print()
-        print("Python Version:", sys.version.split()[0])
-        return 0
+        lines.append("🟢 GREEN LIGHTS - All imports successful from local paths!")
+        lines.append("")
+        lines.append("Package Locations:")
+        lines.extend(
+            f"  • {name}: {path}"
+            for name, _, (_, _, path) in results if path
+        )
     else:
-        print("🔴 RED LIGHTS - Import verification failed!")
-        print()
-        print("Errors:")
-        for name, (success, message, path) in results.items():
-            if not success:
-                print(f"  • {name}: {message}")
-        print()
-        print("Python Version:", sys.version.split()[0])
-        return 1
+        lines.append("🔴 RED LIGHTS - Import verification failed!")
+        lines.append("")
+        lines.append("Errors:")
+        lines.extend(
+            f"  • {name}: {message}"
+            for name, _, (success, message, _) in results if not success
+        )
+
+    lines.append("")
+    lines.append(f"Python Version: {sys.version.split()[0]}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+    return 0 if all_success else 1
 
 
 if __name__ == "__main__":
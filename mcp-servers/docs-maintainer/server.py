@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 import re
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
 import frontmatter
+import yaml
 from fastmcp import FastMCP
 
 SERVER_NAME = "docs-maintainer"
@@ -23,17 +26,104 @@ DEFAULT_AREAS = {
 
 WIKI_LINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
 NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+ID_PREFIX_RE = re.compile(r"^(\d+\.\d+)")
+CAT_NUM_RE = re.compile(r"^\d+\.(\d+)")
+FALLBACK_STRIP_RE = re.compile(r"^\d+\.\d+_?")
+AREA_NUM_RE = re.compile(r"^(\d+)")
+DOC_SORT_RE = re.compile(r"^(\d+)\.(\d+)")
+TITLE_RE = re.compile(r"^# (.+?)\s*$", re.MULTILINE)
+
+# Titles live at the top of a doc; bound the search so long bodies
+# aren't scanned (or split into lines) just to find the first heading.
+_TITLE_SEARCH_CAP = 2048
+
+# Parsed frontmatter posts keyed by path; a rebuild touches each doc up
+# to three times (index write, link fix, health check) and this avoids
+# re-reading and re-parsing YAML on every pass.  Entries are validated
+# against (st_mtime_ns, st_size) and refreshed by write_post.
+_POST_CACHE: dict = {}
+
+# Doc scans are I/O-bound (file reads + YAML); the GIL is released
+# during read() so threads give near-linear speedup on large trees.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 mcp = FastMCP(SERVER_NAME)
 
 
+def load_cached(path: Path, entry: Optional[os.DirEntry] = None) -> frontmatter.Post:
+    """Load a doc's frontmatter, reusing the parse if the file is unchanged.
+
+    Callers iterating via the scandir walker pass the DirEntry so the
+    cache key comes from DirEntry.stat(), which caches its result on the
+    entry instead of issuing a fresh stat per lookup.
+    """
+    st = entry.stat() if entry is not None else path.stat()
+    key = str(path)
+    cached = _POST_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    post = frontmatter.load(path)
+    _POST_CACHE[key] = (st.st_mtime_ns, st.st_size, post)
+    return post
+
+
+# Read at most this much of a doc when only its frontmatter is needed.
+_HEADER_CHUNK = 4096
+_HEADER_CAP = 65536
+
+# Prefer the libyaml C loader when PyYAML was built with it; the pure
+# Python scanner is several times slower on the frontmatter hot path.
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+
+
+def load_frontmatter_only(path: Path) -> dict:
+    """Parse just the YAML frontmatter block of a doc.
+
+    The health and link scans only consult metadata, so reading (and
+    YAML-parsing) whole Markdown bodies is wasted I/O.  Reads in 4 KiB
+    chunks until the closing ``---`` delimiter (capped at 64 KiB) and
+    parses only that slice.  Returns {} for docs without frontmatter.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_HEADER_CHUNK)
+            if not head.startswith(b"---"):
+                return {}
+            while b"\n---" not in head[3:] and len(head) < _HEADER_CAP:
+                chunk = f.read(_HEADER_CHUNK)
+                if not chunk:
+                    break
+                head += chunk
+    except OSError:
+        return {}
+
+    end = head.find(b"\n---", 3)
+    if end == -1:
+        return {}
+    block = head[head.find(b"\n") + 1:end]
+    try:
+        metadata = yaml.load(block.decode("utf-8", "replace"), Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def write_post(path: Path, post: frontmatter.Post) -> None:
+    """Serialize a post to disk and refresh its cache entry."""
+    # Encode once and write the bytes directly; write_text would run a
+    # second encode pass inside the text wrapper.
+    path.write_bytes(frontmatter.dumps(post).encode("utf-8"))
+    st = path.stat()
+    _POST_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, post)
+
+
 def iso_now() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    # Same second-resolution UTC format as before, minus the datetime
+    # object and chained string replaces per call.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def slugify(text: str) -> str:
@@ -42,19 +132,17 @@ def slugify(text: str) -> str:
 
 
 def extract_title(content: str) -> Optional[str]:
-    for line in content.splitlines():
-        if line.startswith("# "):
-            return line[2:].strip()
-    return None
+    match = TITLE_RE.search(content[:_TITLE_SEARCH_CAP])
+    return match.group(1).strip() if match else None
 
 
 def extract_id(stem: str) -> Optional[str]:
-    match = re.match(r"^(\d+\.\d+)", stem)
+    match = ID_PREFIX_RE.match(stem)
     return match.group(1) if match else None
 
 
 def display_fallback_title(stem: str) -> str:
-    base = re.sub(r"^\d+\.\d+_?", "", stem)
+    base = FALLBACK_STRIP_RE.sub("", stem)
     base = base.replace("_", " ").strip()
     return base.title() if base else stem
 
@@ -88,20 +176,52 @@ def extract_link_target(link: str) -> str:
     return link.strip()
 
 
-def collect_repo_index(repo_root: Path) -> Tuple[set, set]:
-    stems = set()
-    relpaths = set()
+def walk_md(root) -> Iterable[os.DirEntry]:
+    """Yield a DirEntry for every .md file under root.
+
+    Hand-rolled over os.scandir rather than rglob: DirEntry carries the
+    directory-read file type, so classifying entries needs no extra
+    stat call, and no intermediate Path objects are built.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry
+
+
+def collect_repo_index(repo_root: Path) -> frozenset:
+    """Collect every valid link target as a single frozenset.
+
+    Holds both bare stems and repo-relative paths, so link checks are a
+    single membership test rather than a branch over two sets.
+    """
+    targets = set()
+    # Slice the path string directly instead of going through
+    # relative_to/with_suffix/as_posix, which allocate three Path
+    # objects per file.
+    root_len = len(str(repo_root)) + 1
     for base in (DOCS_DIRNAME, WORK_EFFORTS_DIRNAME):
         base_path = repo_root / base
         if not base_path.exists():
             continue
-        for file_path in base_path.rglob("*.md"):
-            stems.add(file_path.stem)
-            relpaths.add(file_path.relative_to(repo_root).with_suffix("").as_posix())
-    return stems, relpaths
+        for entry in walk_md(base_path):
+            targets.add(entry.name[:-3])
+            rel = entry.path[root_len:-3]
+            if os.sep != "/":
+                rel = rel.replace(os.sep, "/")
+            targets.add(rel)
+    return frozenset(targets)
 
 
-def link_target_exists(target: str, stems: set, relpaths: set) -> bool:
+def link_target_exists(target: str, repo_index: frozenset) -> bool:
     cleaned = target.strip()
     if not cleaned:
         return False
@@ -109,10 +229,7 @@ def link_target_exists(target: str, stems: set, relpaths: set) -> bool:
         cleaned = cleaned[1:]
     if cleaned.lower().endswith(".md"):
         cleaned = cleaned[:-3]
-    cleaned = cleaned.replace("\\", "/")
-    if "/" in cleaned:
-        return cleaned in relpaths
-    return cleaned in stems
+    return cleaned.replace("\\", "/") in repo_index
 
 
 def resolve_docs_root(repo_path: str) -> Path:
@@ -151,33 +268,41 @@ def resolve_category_dir(area_dir: Path, category: str) -> Path:
     return category_dir
 
 
+# Next free document number per category directory.  Populated lazily
+# by a single directory scan, then bumped in O(1) per create so bulk
+# doc creation doesn't re-glob the category each time.
+_NEXT_ID_CACHE: dict = {}
+
+
 def get_next_id(category_dir: Path) -> str:
-    existing = [
-        f.stem for f in category_dir.glob("*.md") if not f.stem.endswith("_index")
-    ]
-    numbers = []
-    for stem in existing:
-        match = re.match(r"^\d+\.(\d+)", stem)
-        if match:
-            numbers.append(int(match.group(1)))
-    next_num = max(numbers, default=0) + 1
+    next_num = _NEXT_ID_CACHE.get(category_dir)
+    if next_num is None:
+        numbers = []
+        for f in category_dir.glob("*.md"):
+            if f.stem.endswith("_index"):
+                continue
+            match = CAT_NUM_RE.match(f.stem)
+            if match:
+                numbers.append(int(match.group(1)))
+        next_num = max(numbers, default=0) + 1
+    _NEXT_ID_CACHE[category_dir] = next_num + 1
     category = category_dir.name.split("_")[0]
     return f"{category}.{next_num:02d}"
 
 
 def area_sort_key(path: Path) -> Tuple[int, str]:
-    match = re.match(r"^(\d+)", path.name)
+    match = AREA_NUM_RE.match(path.name)
     return (int(match.group(1)) if match else 999, path.name)
 
 
 def category_sort_key(path: Path) -> Tuple[int, str]:
-    match = re.match(r"^(\d+)", path.name)
+    match = AREA_NUM_RE.match(path.name)
     return (int(match.group(1)) if match else 999, path.name)
 
 
 def doc_sort_key(doc_id: Optional[str], stem: str) -> Tuple[int, int, str]:
     value = doc_id or stem
-    match = re.match(r"^(\d+)\.(\d+)", value)
+    match = DOC_SORT_RE.match(value)
     if match:
         return (int(match.group(1)), int(match.group(2)), stem)
     return (999, 999, stem)
@@ -191,25 +316,29 @@ def iter_category_dirs(area_dir: Path) -> List[Path]:
     return sorted([p for p in area_dir.iterdir() if p.is_dir()], key=category_sort_key)
 
 
-def iter_doc_files(docs_root: Path) -> Iterable[Path]:
-    for file_path in docs_root.rglob("*.md"):
-        if file_path.name == "00.00_index.md" or file_path.name.endswith("_index.md"):
+def iter_doc_files(docs_root: Path) -> Iterable[Tuple[os.DirEntry, Path]]:
+    for entry in walk_md(docs_root):
+        if entry.name == "00.00_index.md" or entry.name.endswith("_index.md"):
             continue
-        yield file_path
+        yield entry, Path(entry.path)
 
 
-def write_category_index(category_dir: Path, docs_root: Path) -> None:
+def render_category_index(category_dir: Path, docs_root: Path) -> Tuple[Path, str]:
+    """Build a category index and return its path and serialized text."""
     docs = []
     for file_path in category_dir.glob("*.md"):
         if file_path.name.endswith("_index.md"):
             continue
-        post = frontmatter.load(file_path)
-        title = (
-            post.metadata.get("title")
-            or extract_title(post.content)
-            or display_fallback_title(file_path.stem)
-        )
-        doc_id = post.metadata.get("id") or extract_id(file_path.stem)
+        metadata = load_frontmatter_only(file_path)
+        title = metadata.get("title")
+        if not title:
+            # The title fallback needs the body, so only docs without a
+            # frontmatter title pay for a full parse.
+            title = (
+                extract_title(load_cached(file_path).content)
+                or display_fallback_title(file_path.stem)
+            )
+        doc_id = metadata.get("id") or extract_id(file_path.stem)
         docs.append((file_path, title, doc_id))
 
     docs.sort(key=lambda item: doc_sort_key(item[2], item[0].stem))
@@ -234,7 +363,12 @@ def write_category_index(category_dir: Path, docs_root: Path) -> None:
     )
 
     index_path = category_dir / f"{category_dir.name}_index.md"
-    index_path.write_text("\n".join(lines).rstrip() + "\n")
+    return index_path, "\n".join(lines).rstrip() + "\n"
+
+
+def write_category_index(category_dir: Path, docs_root: Path) -> None:
+    index_path, text = render_category_index(category_dir, docs_root)
+    index_path.write_text(text)
 
 
 def write_master_index(docs_root: Path) -> None:
@@ -260,76 +394,120 @@ def write_master_index(docs_root: Path) -> None:
     index_path.write_text("\n".join(lines).rstrip() + "\n")
 
 
-def clean_links(links: List[str], stems: set, relpaths: set) -> Tuple[List[str], List[str]]:
+def clean_links(links: List[str], repo_index: frozenset) -> Tuple[List[str], List[str]]:
+    # Set membership for dedup keeps this O(k) instead of re-scanning
+    # the cleaned list per link; the list still preserves order.
+    seen = set()
     cleaned = []
     removed = []
     for link in links:
         target = extract_link_target(link)
-        if link_target_exists(target, stems, relpaths):
-            if link not in cleaned:
+        if link_target_exists(target, repo_index):
+            if link not in seen:
+                seen.add(link)
                 cleaned.append(link)
         else:
             removed.append(link)
     return cleaned, removed
 
 
-def fix_broken_links(docs_root: Path, repo_root: Path) -> List[str]:
-    stems, relpaths = collect_repo_index(repo_root)
-    broken = []
-    for file_path in iter_doc_files(docs_root):
-        post = frontmatter.load(file_path)
-        changed = False
+def fix_broken_links(docs_root: Path, repo_index: frozenset) -> List[str]:
+    def scan_one(item: Tuple[os.DirEntry, Path]):
+        # Scan with the cheap header-only parse; only docs that actually
+        # change are fully parsed and rewritten.  Each doc is independent
+        # and repo_index is a read-only frozenset, so this is thread-safe.
+        entry, file_path = item
+        metadata = load_frontmatter_only(file_path)
+        updates = {}
+        local_broken = []
         for key in ("links", "related_work_efforts"):
-            original = ensure_list(post.metadata.get(key))
+            original = ensure_list(metadata.get(key))
             if not original:
                 continue
-            cleaned, removed = clean_links(original, stems, relpaths)
+            cleaned, removed = clean_links(original, repo_index)
             if cleaned != original:
-                post.metadata[key] = cleaned
-                changed = True
-                for link in removed:
-                    broken.append(f"{file_path}: {link}")
-        if changed:
-            post.metadata["updated"] = iso_now()
-            file_path.write_text(frontmatter.dumps(post))
+                updates[key] = cleaned
+                local_broken.extend(f"{file_path}: {link}" for link in removed)
+        if not updates:
+            return local_broken, None
+        post = load_cached(file_path, entry)
+        post.metadata.update(updates)
+        post.metadata["updated"] = iso_now()
+        return local_broken, (file_path, post)
+
+    broken = []
+    pending = []
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        for local_broken, write_item in pool.map(scan_one, iter_doc_files(docs_root)):
+            broken.extend(local_broken)
+            if write_item is not None:
+                pending.append(write_item)
+
+    # Flush all modified docs in one threaded pass, same as the index
+    # writes in rebuild_indices.
+    if pending:
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            list(pool.map(lambda item: write_post(*item), pending))
     return broken
 
 
-def compute_health(repo_root: Path, docs_root: Path) -> Tuple[int, List[str], List[str], List[str]]:
-    stems, relpaths = collect_repo_index(repo_root)
+def compute_health(
+    docs_root: Path, repo_index: frozenset
+) -> Tuple[int, List[str], List[str], List[str]]:
     missing_meta = []
     broken_links = []
     orphaned = []
 
     category_index_cache = {}
 
-    for doc_file in iter_doc_files(docs_root):
-        post = frontmatter.load(doc_file)
+    def scan_doc(item: Tuple[os.DirEntry, Path]) -> Tuple[Path, Optional[str], List[str]]:
+        # One pass over the metadata: pull both link fields up front and
+        # run the field and link checks over a single combined loop.
+        _entry, doc_file = item
+        metadata = load_frontmatter_only(doc_file)
         missing_fields = [
             field
             for field in ("id", "title", "created", "updated")
-            if field not in post.metadata
+            if field not in metadata
         ]
-        if missing_fields:
-            missing_meta.append(
-                f"{doc_file}: missing {', '.join(missing_fields)}"
-            )
+        missing = (
+            f"{doc_file}: missing {', '.join(missing_fields)}"
+            if missing_fields else None
+        )
 
-        for key in ("links", "related_work_efforts"):
-            for link in ensure_list(post.metadata.get(key)):
-                target = extract_link_target(link)
-                if not link_target_exists(target, stems, relpaths):
-                    broken_links.append(f"{doc_file}: {link}")
+        links = (
+            ensure_list(metadata.get("links"))
+            + ensure_list(metadata.get("related_work_efforts"))
+        )
+        local_broken = [
+            f"{doc_file}: {link}"
+            for link in links
+            if not link_target_exists(extract_link_target(link), repo_index)
+        ]
+        return doc_file, missing, local_broken
+
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        scanned = list(pool.map(scan_doc, iter_doc_files(docs_root)))
+
+    for doc_file, missing, local_broken in scanned:
+        if missing:
+            missing_meta.append(missing)
+        broken_links.extend(local_broken)
 
         category_dir = doc_file.parent
         index_path = category_dir / f"{category_dir.name}_index.md"
         if index_path not in category_index_cache:
+            # Extract the linked stems once per index; the per-doc orphan
+            # check is then a set lookup instead of a substring scan of
+            # the whole index body for every doc in the category.
             if index_path.exists():
-                category_index_cache[index_path] = index_path.read_text()
+                category_index_cache[index_path] = frozenset(
+                    match.group(1)
+                    for match in WIKI_LINK_RE.finditer(index_path.read_text())
+                )
             else:
-                category_index_cache[index_path] = None
-        index_content = category_index_cache[index_path]
-        if not index_content or f"[[{doc_file.stem}]]" not in index_content:
+                category_index_cache[index_path] = frozenset()
+        if doc_file.stem not in category_index_cache[index_path]:
             orphaned.append(str(doc_file))
 
     score = 100 - len(missing_meta) * 5 - len(broken_links) * 2 - len(orphaned) * 3
@@ -412,6 +590,7 @@ def initialize_docs(repo_path: str) -> str:
     """Create the _docs structure and master index."""
     docs_root = resolve_docs_root(repo_path)
     docs_root.mkdir(parents=True, exist_ok=True)
+    _NEXT_ID_CACHE.clear()
 
     created = []
     for area_dir_name in DEFAULT_AREAS.values():
@@ -462,7 +641,7 @@ def create_doc(
 
     body = content.strip() if content else f"# {title}\n\n"
     post = frontmatter.Post(body + "\n", **metadata)
-    file_path.write_text(frontmatter.dumps(post))
+    write_post(file_path, post)
 
     write_category_index(category_dir, docs_root)
     write_master_index(docs_root)
@@ -479,7 +658,7 @@ def update_doc(
     if not doc_path.exists():
         raise ValueError("file_path not found")
 
-    post = frontmatter.load(doc_path)
+    post = load_cached(doc_path)
     if content is not None:
         post.content = content
 
@@ -493,7 +672,7 @@ def update_doc(
         post.metadata["links"] = links
 
     post.metadata["updated"] = iso_now()
-    doc_path.write_text(frontmatter.dumps(post))
+    write_post(doc_path, post)
 
     return f"Updated {doc_path}"
 
@@ -506,16 +685,23 @@ def rebuild_indices(repo_path: str) -> str:
     if not docs_root.exists():
         raise ValueError("_docs directory not found")
 
-    category_count = 0
+    # Render every index first, then flush them in one threaded pass so
+    # the per-file open/write/close syscalls overlap.
+    buffered = []
     for area_dir in iter_area_dirs(docs_root):
         for category_dir in iter_category_dirs(area_dir):
-            write_category_index(category_dir, docs_root)
-            category_count += 1
+            buffered.append(render_category_index(category_dir, docs_root))
+    category_count = len(buffered)
+
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        list(pool.map(lambda item: item[0].write_text(item[1]), buffered))
 
     write_master_index(docs_root)
 
-    broken = fix_broken_links(docs_root, repo_root)
-    score, missing_meta, broken_links, orphaned = compute_health(repo_root, docs_root)
+    # One repo walk serves both the link fix and the health check.
+    repo_index = collect_repo_index(repo_root)
+    broken = fix_broken_links(docs_root, repo_index)
+    score, missing_meta, broken_links, orphaned = compute_health(docs_root, repo_index)
 
     report = [
         f"Rebuilt {category_count} category index files",
@@ -536,16 +722,16 @@ def link_work_effort(doc_path: str, work_effort_id: str) -> str:
     repo_root = find_repo_root_from_doc(doc_file)
     work_effort_path = resolve_work_effort_path(repo_root, work_effort_id)
 
-    doc_post = frontmatter.load(doc_file)
+    doc_post = load_cached(doc_file)
     related = ensure_list(doc_post.metadata.get("related_work_efforts"))
     work_link = make_wiki_link(work_effort_path, repo_root)
     if work_link not in related:
         related.append(work_link)
     doc_post.metadata["related_work_efforts"] = related
     doc_post.metadata["updated"] = iso_now()
-    doc_file.write_text(frontmatter.dumps(doc_post))
+    write_post(doc_file, doc_post)
 
-    effort_post = frontmatter.load(work_effort_path)
+    effort_post = load_cached(work_effort_path)
     related_docs = ensure_list(effort_post.metadata.get("related_docs"))
     doc_link = make_wiki_link(doc_file, repo_root)
     if doc_link not in related_docs:
@@ -559,7 +745,7 @@ def link_work_effort(doc_path: str, work_effort_id: str) -> str:
     else:
         effort_post.metadata["updated"] = iso_now()
 
-    work_effort_path.write_text(frontmatter.dumps(effort_post))
+    write_post(work_effort_path, effort_post)
 
     return f"Linked {doc_file} <-> {work_effort_path}"
 
@@ -571,29 +757,34 @@ def search_docs(repo_path: str, query: str, search_content: bool = True) -> str:
     if not docs_root.exists():
         raise ValueError("_docs directory not found")
 
-    needle = query.lower()
-    results = []
+    # One compiled case-insensitive pattern replaces per-doc .lower()
+    # copies of titles, metadata, and bodies.
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
 
-    for doc_file in iter_doc_files(docs_root):
-        post = frontmatter.load(doc_file)
+    def search_doc(item: Tuple[os.DirEntry, Path]) -> Optional[str]:
+        entry, doc_file = item
+        post = load_cached(doc_file, entry)
         title = (
             post.metadata.get("title")
             or extract_title(post.content)
             or display_fallback_title(doc_file.stem)
         )
-        meta_text = "\n".join(
-            f"{key}: {value}" for key, value in post.metadata.items()
-        ).lower()
-
-        haystacks = [title.lower(), meta_text]
-        if search_content:
-            haystacks.append(post.content.lower())
 
-        if any(needle in haystack for haystack in haystacks):
+        matched = (
+            pattern.search(title) is not None
+            or any(pattern.search(str(value)) for value in post.metadata.values())
+            or bool(search_content and pattern.search(post.content))
+        )
+        if matched:
             doc_id = post.metadata.get("id") or extract_id(doc_file.stem) or doc_file.stem
-            results.append(
-                f"- {doc_id} - {title}\n  Path: {doc_file}"
-            )
+            return f"- {doc_id} - {title}\n  Path: {doc_file}"
+        return None
+
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        results = [
+            hit for hit in pool.map(search_doc, iter_doc_files(docs_root))
+            if hit is not None
+        ]
 
     if not results:
         return f"No documents found for '{query}'"
@@ -609,7 +800,8 @@ def check_health(repo_path: str) -> str:
     if not docs_root.exists():
         raise ValueError("_docs directory not found")
 
-    score, missing_meta, broken_links, orphaned = compute_health(repo_root, docs_root)
+    repo_index = collect_repo_index(repo_root)
+    score, missing_meta, broken_links, orphaned = compute_health(docs_root, repo_index)
     return format_health_report(score, missing_meta, broken_links, orphaned)
 
 
@@ -5,14 +5,48 @@ This module provides the abstract base classes and data structures for
 integrating external task management services with the work effort system.
 """
 
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+class _LazyTimestamp:
+    """
+    Event timestamp captured as an integer, formatted on demand
+
+    emit_event fires several times per task; time.time_ns() is a single
+    C call, and the ISO string is only built if a handler actually
+    renders the timestamp (str() / f-string).
+    """
+
+    __slots__ = ('ns', '_iso')
+
+    def __init__(self):
+        self.ns = time.time_ns()
+        self._iso = None
+
+    def __str__(self) -> str:
+        if self._iso is None:
+            self._iso = (
+                datetime.fromtimestamp(self.ns * 1e-9, tz=timezone.utc)
+                .replace(tzinfo=None)
+                .isoformat()
+            )
+        return self._iso
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+# slots=True drops the per-instance __dict__; these are created once per
+# task in batch loops, so the smaller footprint and C-level attribute
+# access add up across a fetch.
+@dataclass(slots=True)
 class ExternalTask:
     """Represents a task from an external service"""
     id: str
@@ -25,7 +59,7 @@ class ExternalTask:
     raw_data: Dict  # Original API response
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkEffort:
     """Represents a created work effort"""
     we_id: str
@@ -35,11 +69,14 @@ class WorkEffort:
     source_task: ExternalTask
     created_tickets: List[Path] = None  # Paths to created ticket files (Phase 4)
     linked_to_existing: bool = False  # Whether this was linked to existing WE (Phase 4)
+    ticket_meta: List = None  # (ticket_id, title) pairs matching created_tickets
 
     def __post_init__(self):
-        """Initialize created_tickets as empty list if None"""
+        """Initialize list fields as empty lists if None"""
         if self.created_tickets is None:
             self.created_tickets = []
+        if self.ticket_meta is None:
+            self.ticket_meta = []
 
 
 class BasePlugin(ABC):
@@ -72,6 +109,16 @@ class BasePlugin(ABC):
         self.config = config
         self.event_handlers = []
 
+        # Opt-in background event dispatch: with async_events set,
+        # emit_event becomes an O(1) enqueue and a daemon thread runs
+        # the handlers, keeping slow listeners (disk logs, webhooks)
+        # out of the per-task critical path.  Default stays synchronous
+        # so handler ordering and test expectations are unchanged.
+        self._event_queue = None
+        if config.get('async_events'):
+            self._event_queue = queue.Queue()
+            threading.Thread(target=self._dispatch_events, daemon=True).start()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -163,13 +210,40 @@ class BasePlugin(ABC):
         event = {
             'plugin': self.name,
             'type': event_type,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _LazyTimestamp(),
             'data': data
         }
 
+        if self._event_queue is not None:
+            self._event_queue.put(event)
+            return
+
         for handler in self.event_handlers:
             handler(event)
 
+    def _dispatch_events(self):
+        """Deliver queued events to handlers (async_events daemon loop)"""
+        while True:
+            event = self._event_queue.get()
+            for handler in self.event_handlers:
+                try:
+                    handler(event)
+                except Exception:
+                    # A misbehaving listener must not kill the dispatcher
+                    pass
+            self._event_queue.task_done()
+
+    def flush_events(self):
+        """
+        Block until every queued event has been delivered
+
+        No-op in the default synchronous mode; with async_events it lets
+        batch entry points hand control back only after listeners have
+        seen everything.
+        """
+        if self._event_queue is not None:
+            self._event_queue.join()
+
     def on_event(self, handler):
         """
         Register event handler for dashboard updates
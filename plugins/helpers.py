@@ -5,13 +5,46 @@ Common utilities for generating work effort IDs, sanitizing titles,
 and validating folder names using the naming linter.
 """
 
+import os
 import re
-import random
-import string
+import secrets
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Compiled once; sanitize_title runs for every task title and again for
+# every ticket filename, so skip the re-cache lookup per call.
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Happy-path shape for '<WE-id>_<slug>' folder names.  A fullmatch here
+# lets validate_folder_name skip the linter entirely; only names that
+# fail it go to the linter for a descriptive error.
+_WE_FOLDER_RE = re.compile(r'^WE-\d{6}-[a-z0-9]{4}_[a-z0-9_]{1,50}$')
+
+# Resolve the linter once at import instead of paying the try/except
+# import machinery on every validation call.
+try:
+    from tools.naming_linter.rules.common import (
+        validate_we_folder_name as _validate_we_folder_name,
+    )
+except ImportError:
+    # Naming linter not available - skip validation
+    _validate_we_folder_name = None
+
+# Cached {we_id: Path} per work-efforts directory, validated against the
+# directory's mtime so folders created or removed by other processes
+# trigger a rebuild.  Keeps batch lookups O(1) instead of a full
+# directory scan per call.
+_WE_INDEX: dict = {}
+
+# ASCII fast path: a precomputed translation table maps every character
+# that isn't [a-z0-9] to '_' as a C-level lookup, no regex engine.
+# Non-ASCII titles fall back to the regex, which handles all of Unicode.
+_SANITIZE_TBL = str.maketrans({
+    c: '_' for c in map(chr, range(128))
+    if not ('a' <= c <= 'z' or '0' <= c <= '9')
+})
+
 
 def generate_we_id() -> str:
     """
@@ -24,9 +57,10 @@ def generate_we_id() -> str:
         >>> we_id = generate_we_id()
         >>> print(we_id)  # WE-260101-a7b3
     """
-    date_str = datetime.now().strftime('%y%m%d')
-    random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-    return f"WE-{date_str}-{random_str}"
+    # token_hex pulls 4 hex chars from the OS CSPRNG in one call — no
+    # per-char Mersenne Twister draws, and no collision risk from
+    # identically-seeded parallel workers.
+    return f"WE-{datetime.now():%y%m%d}-{secrets.token_hex(2)}"
 
 
 def sanitize_title(title: str, max_length: int = 50) -> str:
@@ -46,17 +80,19 @@ def sanitize_title(title: str, max_length: int = 50) -> str:
         >>> sanitize_title("Fix Bug #123: Login Error")
         'fix_bug_123_login_error'
     """
-    # Convert to lowercase
     title = title.lower()
 
-    # Replace spaces and special chars with underscores
-    title = re.sub(r'[^a-z0-9]+', '_', title)
-
-    # Remove leading/trailing underscores
-    title = title.strip('_')
-
-    # Collapse multiple consecutive underscores
-    title = re.sub(r'_+', '_', title)
+    if title.isascii():
+        # Table lookup per char, then collapse runs of underscores with
+        # C-level replace (halves the run length each iteration).
+        title = title.translate(_SANITIZE_TBL)
+        while '__' in title:
+            title = title.replace('__', '_')
+        title = title.strip('_')
+    else:
+        # Regex substitution covers non-ASCII characters and already
+        # collapses separator runs via the + quantifier.
+        title = _NON_ALNUM_RE.sub('_', title).strip('_')
 
     # Truncate if too long
     if len(title) > max_length:
@@ -80,12 +116,11 @@ def validate_folder_name(folder_name: str) -> Optional[str]:
         >>> if error:
         ...     print(f"Invalid: {error}")
     """
-    try:
-        from tools.naming_linter.rules.common import validate_we_folder_name
-        return validate_we_folder_name(folder_name)
-    except ImportError:
-        # Naming linter not available - skip validation
+    if _WE_FOLDER_RE.fullmatch(folder_name):
+        return None
+    if _validate_we_folder_name is None:
         return None
+    return _validate_we_folder_name(folder_name)
 
 
 def create_work_effort_structure(
@@ -125,12 +160,21 @@ def create_work_effort_structure(
         if error:
             raise ValueError(f"Invalid folder name '{folder_name}': {error}")
 
-    # Create directory structure
+    # Create directory structure: one makedirs call builds the folder
+    # and its tickets/ subdirectory together.
     folder_path = base_path / folder_name
-    folder_path.mkdir(parents=True, exist_ok=True)
-
     tickets_dir = folder_path / "tickets"
-    tickets_dir.mkdir(exist_ok=True)
+    os.makedirs(tickets_dir, exist_ok=True)
+
+    # Keep the lookup index warm: record the new folder and refresh the
+    # stored mtime so our own write doesn't force a rebuild.
+    cached = _WE_INDEX.get(str(base_path))
+    if cached is not None:
+        try:
+            cached[1][we_id] = folder_path
+            _WE_INDEX[str(base_path)] = (os.stat(base_path).st_mtime_ns, cached[1])
+        except OSError:
+            _WE_INDEX.pop(str(base_path), None)
 
     index_path = folder_path / f"{we_id}_index.md"
 
@@ -156,15 +200,24 @@ def find_work_effort_by_id(base_path: Path, we_id: str) -> Optional[Path]:
         >>> if we_path:
         ...     print(f"Found: {we_path}")
     """
-    if not base_path.exists():
+    # Folder names are '<we_id>_<title>', so the prefix before the first
+    # underscore is the WE-ID; one scan builds the whole lookup table.
+    try:
+        mtime = os.stat(base_path).st_mtime_ns
+    except OSError:
         return None
 
-    # Search for directories starting with the WE-ID
-    for entry in base_path.iterdir():
-        if entry.is_dir() and entry.name.startswith(we_id):
-            return entry
+    key = str(base_path)
+    cached = _WE_INDEX.get(key)
+    if cached is None or cached[0] != mtime:
+        index = {}
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    index[entry.name.split('_', 1)[0]] = Path(entry.path)
+        _WE_INDEX[key] = cached = (mtime, index)
 
-    return None
+    return cached[1].get(we_id)
 
 
 def generate_ticket_id(we_id: str, sequence: int) -> str:
@@ -197,7 +250,8 @@ def create_ticket_file(
     description: Optional[str] = None,
     source_task_id: Optional[str] = None,
     source_url: Optional[str] = None,
-    labels: Optional[list[str]] = None
+    labels: Optional[list[str]] = None,
+    created: Optional[datetime] = None
 ) -> Path:
     """
     Create a ticket file in the tickets directory
@@ -210,6 +264,8 @@ def create_ticket_file(
         source_task_id: ID of source task (optional)
         source_url: URL to source task (optional)
         labels: List of labels/tags (optional)
+        created: Creation timestamp; pass one shared value when creating
+            a batch of tickets (defaults to now)
 
     Returns:
         Path to created ticket file
@@ -230,41 +286,39 @@ def create_ticket_file(
     filename = f"{ticket_id}_{sanitized_title}.md"
     ticket_path = tickets_dir / filename
 
-    # Build YAML frontmatter
-    created_iso = datetime.now().isoformat()
-    frontmatter = f"""---
+    # Assemble the document as a list of fragments and join once; no
+    # intermediate strings rebuilt per concatenation.
+    created_iso = (created or datetime.now()).isoformat()
+    parts = [f"""---
 id: {ticket_id}
 title: "{title}"
 status: pending
 created: {created_iso}
-"""
+"""]
 
     if source_task_id:
-        frontmatter += f"source_task_id: {source_task_id}\n"
+        parts.append(f"source_task_id: {source_task_id}\n")
     if source_url:
-        frontmatter += f"source_url: {source_url}\n"
+        parts.append(f"source_url: {source_url}\n")
     if labels:
-        frontmatter += f"labels: {labels}\n"
+        parts.append(f"labels: {labels}\n")
 
-    frontmatter += "---\n"
-
-    # Build markdown content
-    content = f"{frontmatter}\n# {title}\n\n"
+    parts.append(f"---\n\n# {title}\n\n")
 
     if description:
-        content += f"## Description\n\n{description}\n\n"
+        parts.append(f"## Description\n\n{description}\n\n")
 
-    content += """## Status
+    parts.append("""## Status
 
 - [ ] Not started
 
 ## Notes
 
 Add implementation notes here.
-"""
+""")
 
-    # Write ticket file
-    ticket_path.write_text(content)
+    # Write ticket file: encode once and skip write_text's codec setup.
+    ticket_path.write_bytes(''.join(parts).encode('utf-8'))
     return ticket_path
 
 
@@ -304,41 +358,39 @@ def format_index_file(
     created_iso = (created or datetime.now()).isoformat()
     labels_str = labels or []
 
-    # Build YAML frontmatter
-    frontmatter = f"""---
+    # Same fragment-list assembly as create_ticket_file: append pieces
+    # and join once at the end.
+    parts = [f"""---
 id: {we_id}
 title: "{title}"
 status: in_progress
 created: {created_iso}
-"""
+"""]
 
     if source:
-        frontmatter += f"source: {source}\n"
+        parts.append(f"source: {source}\n")
     if source_url:
-        frontmatter += f"source_url: {source_url}\n"
+        parts.append(f"source_url: {source_url}\n")
     if labels_str:
-        frontmatter += f"labels: {labels_str}\n"
-
-    frontmatter += "---\n"
+        parts.append(f"labels: {labels_str}\n")
 
-    # Build markdown content
-    content = f"{frontmatter}\n# {title}\n\n"
+    parts.append(f"---\n\n# {title}\n\n")
 
     if description:
-        content += f"## Description\n\n{description}\n\n"
+        parts.append(f"## Description\n\n{description}\n\n")
 
     if source and source_url:
-        content += f"""## Source Task
+        parts.append(f"""## Source Task
 
 - **Service**: {source}
 - **URL**: {source_url}
-"""
+""")
         if labels_str:
-            content += f"- **Labels**: {', '.join(labels_str)}\n"
+            parts.append(f"- **Labels**: {', '.join(labels_str)}\n")
 
-        content += "\n"
+        parts.append("\n")
 
-    content += """## Progress
+    parts.append("""## Progress
 
 - Work effort created
 - Ready for implementation
@@ -348,6 +400,6 @@ created: {created_iso}
 1. Review task requirements
 2. Create tickets in `tickets/` directory
 3. Begin implementation
-"""
+""")
 
-    return content
+    return ''.join(parts)
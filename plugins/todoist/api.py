@@ -5,14 +5,72 @@ Handles authentication and API calls to Todoist REST API v2.
 Documentation: https://developer.todoist.com/rest/v2/
 """
 
+import hashlib
+import time
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime
 
 
 class TodoistAPIError(Exception):
-    """Raised when Todoist API returns an error"""
-    pass
+    """
+    Raised when Todoist API returns an error
+
+    Carries the HTTP status (and Retry-After, when the server sent one)
+    so callers can tell transient failures (429, 5xx) apart from
+    unrecoverable ones (auth, bad request) without parsing the message.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+# One pooled session per API token, shared across client instances so a
+# plugin and a standalone client reuse the same warm connections instead
+# of each paying TCP/TLS setup.
+_SESSIONS: Dict[str, requests.Session] = {}
+
+
+def _get_session(api_token: str) -> requests.Session:
+    """Return the shared pooled session for a token, creating it once."""
+    session = _SESSIONS.get(api_token)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.25,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Hand back the final response instead of raising
+                # RetryError once attempts are exhausted; _request's
+                # raise_for_status() then surfaces a TodoistAPIError
+                # that carries the status and Retry-After, which the
+                # poll loop's 429 handling depends on.
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.headers.update({
+            'Authorization': f'Bearer {api_token}',
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip'
+        })
+        _SESSIONS[api_token] = session
+    return session
 
 
 class TodoistAPI:
@@ -28,6 +86,12 @@ class TodoistAPI:
     """
 
     BASE_URL = "https://api.todoist.com/rest/v2"
+    SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+
+    # TTLs for cached GET responses: tasks move quickly, labels rarely.
+    TASK_CACHE_TTL = 30.0
+    LABELS_CACHE_TTL = 300.0
+    _CACHE_MAX = 500
 
     def __init__(self, api_token: str):
         """
@@ -37,11 +101,15 @@ class TodoistAPI:
             api_token: Todoist API token (from Settings -> Integrations -> Developer)
         """
         self.api_token = api_token
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'Bearer {api_token}',
-            'Content-Type': 'application/json'
-        })
+        self.session = _get_session(api_token)
+        # Cached GET responses keyed by (endpoint, params), each entry a
+        # (timestamp, data) pair.  Insertion order doubles as eviction
+        # order when the cache fills.
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # Per-label (digest, parsed) pairs for get_tasks; polls usually
+        # return an unchanged body, so a hash comparison skips re-parsing
+        # and re-allocating the whole task list.
+        self._tasks_cache: Dict[Optional[str], Tuple[bytes, List[Dict]]] = {}
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
@@ -58,7 +126,13 @@ class TodoistAPI:
         Raises:
             TodoistAPIError: If API returns error status
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        # sync_commands passes a full URL; everything else is a REST path
+        url = endpoint if endpoint.startswith('https://') else f"{self.BASE_URL}{endpoint}"
+
+        # Serialize request bodies with orjson when available; the
+        # session's Content-Type header already declares JSON.
+        if orjson is not None and 'json' in kwargs:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
 
         try:
             response = self.session.request(method, url, **kwargs)
@@ -71,10 +145,69 @@ class TodoistAPI:
                 error_msg += f" - {error_data}"
             except:
                 error_msg += f" - {e.response.text}"
-            raise TodoistAPIError(error_msg) from e
+            raise TodoistAPIError(
+                error_msg,
+                status_code=e.response.status_code,
+                retry_after=self._retry_after(e.response)
+            ) from e
         except requests.exceptions.RequestException as e:
+            # Some transport errors still carry the offending response
+            # (e.g. exceptions raised mid-redirect); keep the status and
+            # Retry-After attached when they do.
+            response = getattr(e, 'response', None)
+            if response is not None:
+                raise TodoistAPIError(
+                    f"Network error: {str(e)}",
+                    status_code=response.status_code,
+                    retry_after=self._retry_after(response)
+                ) from e
             raise TodoistAPIError(f"Network error: {str(e)}") from e
 
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Parse a response's Retry-After header as seconds, if present"""
+        value = response.headers.get('Retry-After')
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _json(response: requests.Response):
+        """Decode a response body, preferring the orjson C decoder"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _cached_get(self, endpoint: str, params: Optional[Dict] = None,
+                    ttl: float = TASK_CACHE_TTL):
+        """
+        GET an endpoint through the TTL cache
+
+        Args:
+            endpoint: API endpoint (e.g., '/tasks/123')
+            params: Query parameters (optional)
+            ttl: How long a cached response stays fresh, in seconds
+
+        Returns:
+            Parsed JSON response (cached or fresh)
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else None)
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+
+        data = self._json(self._request('GET', endpoint, params=params))
+        if len(self._cache) >= self._CACHE_MAX:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (now, data)
+        return data
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop the cached response for an endpoint after a mutation"""
+        self._cache.pop((endpoint, None), None)
+
     def get_tasks(self, label: Optional[str] = None) -> List[Dict]:
         """
         Fetch tasks, optionally filtered by label
@@ -95,7 +228,51 @@ class TodoistAPI:
             params['filter'] = f'@{label}'
 
         response = self._request('GET', '/tasks', params=params)
-        return response.json()
+
+        # Client-side conditional GET: if the raw body matches the last
+        # poll for this label, hand back the previously parsed list.
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        cached = self._tasks_cache.get(label)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        tasks = self._json(response)
+        self._tasks_cache[label] = (digest, tasks)
+        return tasks
+
+    def iter_tasks(self, label: Optional[str] = None, page_size: int = 200):
+        """
+        Stream tasks page by page, following cursor pagination
+
+        get_tasks materializes the full response before the caller sees
+        the first task; this generator yields tasks as each page
+        arrives, so downstream conversion overlaps the remaining fetch
+        I/O on large accounts.  REST v2 currently answers /tasks with a
+        plain unpaginated list, which is treated as a single page, but
+        cursor responses ({'results': [...], 'next_cursor': ...}) are
+        followed automatically.
+
+        Args:
+            label: Filter tasks by label name (optional)
+            page_size: Tasks requested per round-trip
+
+        Yields:
+            Task dictionaries
+        """
+        params: Dict = {'limit': page_size}
+        if label:
+            params['filter'] = f'@{label}'
+
+        while True:
+            data = self._json(self._request('GET', '/tasks', params=params))
+            if isinstance(data, list):
+                yield from data
+                return
+            yield from data.get('results', [])
+            cursor = data.get('next_cursor')
+            if not cursor:
+                return
+            params['cursor'] = cursor
 
     def get_task(self, task_id: str) -> Dict:
         """
@@ -107,8 +284,7 @@ class TodoistAPI:
         Returns:
             Task dictionary
         """
-        response = self._request('GET', f'/tasks/{task_id}')
-        return response.json()
+        return self._cached_get(f'/tasks/{task_id}', ttl=self.TASK_CACHE_TTL)
 
     def add_comment(self, task_id: str, content: str) -> Dict:
         """
@@ -130,7 +306,7 @@ class TodoistAPI:
         }
 
         response = self._request('POST', '/comments', json=data)
-        return response.json()
+        return self._json(response)
 
     def get_labels(self) -> List[Dict]:
         """
@@ -139,8 +315,25 @@ class TodoistAPI:
         Returns:
             List of label dictionaries
         """
-        response = self._request('GET', '/labels')
-        return response.json()
+        return self._cached_get('/labels', ttl=self.LABELS_CACHE_TTL)
+
+    def label_id_for(self, name: str) -> Optional[str]:
+        """
+        Resolve a label name to its Todoist ID
+
+        Backed by the TTL-cached get_labels, so repeated lookups within
+        the cache window cost no API call.
+
+        Args:
+            name: Label name (e.g., 'pyrite')
+
+        Returns:
+            Label ID string, or None if no label has that name
+        """
+        for label in self.get_labels():
+            if label.get('name') == name:
+                return label.get('id')
+        return None
 
     def update_task(self, task_id: str, **kwargs) -> Dict:
         """
@@ -157,7 +350,8 @@ class TodoistAPI:
             >>> api.update_task('123', labels=['work', 'urgent'])
         """
         response = self._request('POST', f'/tasks/{task_id}', json=kwargs)
-        return response.json()
+        self._invalidate(f'/tasks/{task_id}')
+        return self._json(response)
 
     def remove_label_from_task(self, task_id: str, label_name: str) -> Dict:
         """
@@ -197,8 +391,53 @@ class TodoistAPI:
             True if successful
         """
         self._request('POST', f'/tasks/{task_id}/close')
+        self._invalidate(f'/tasks/{task_id}')
         return True
 
+    def sync_commands(self, commands: List[Dict]) -> Dict:
+        """
+        Execute a batch of Sync API commands in a single request
+
+        The Sync API takes an array of commands per POST, so N comment
+        additions and label updates cost one round-trip instead of N.
+        Missing 'uuid'/'temp_id' fields are filled in automatically.
+
+        Args:
+            commands: List of command dicts with 'type' and 'args' keys
+
+        Returns:
+            Sync API response dictionary
+
+        Raises:
+            TodoistAPIError: If the request fails or a command is rejected
+
+        Example:
+            >>> api.sync_commands([
+            ...     {'type': 'note_add',
+            ...      'args': {'item_id': '123', 'content': 'Done!'}}
+            ... ])
+        """
+        if not commands:
+            return {}
+
+        for command in commands:
+            command.setdefault('uuid', str(uuid.uuid4()))
+            command.setdefault('temp_id', str(uuid.uuid4()))
+
+        response = self._request('POST', self.SYNC_URL, json={'commands': commands})
+        result = self._json(response)
+
+        # Per-command status lives in sync_status; anything that is not
+        # the literal 'ok' is an error object.
+        errors = [
+            status for status in result.get('sync_status', {}).values()
+            if status != 'ok'
+        ]
+        if errors:
+            raise TodoistAPIError(f"Sync command failed: {errors[0]}")
+
+        return result
+
     def validate_token(self) -> bool:
         """
         Validate API token by making a test request
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Todoist Daemon
+
+Long-running worker that processes task IDs sent over a UNIX socket.
+Keeps the interpreter, plugin, and pooled API session warm between
+events instead of paying Python startup plus TLS handshake per
+invocation — useful when a webhook handler triggers work effort
+creation one task at a time.
+
+Usage:
+    # Start the daemon
+    python plugins/todoist/daemon.py
+
+    # Send a task ID from a webhook handler or shell
+    python plugins/todoist/daemon.py --send 1234567890
+
+Protocol:
+    One task ID per line.  The daemon replies with one line per task:
+    "OK <we_id>" on success or "ERR <message>" on failure.
+"""
+
+import argparse
+import os
+import socket
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from plugins.todoist import TodoistPlugin
+from plugins.todoist.poll import load_config
+
+SOCKET_PATH = "/tmp/pyrite-todoist.sock"
+
+# In-flight pipeline runs keyed by task ID.  Webhook retries and
+# double-clicks commonly resend a task that is already being processed;
+# duplicates wait on the first run and share its result instead of
+# re-issuing the REST calls and racing the mkdirs.
+_in_flight: dict = {}
+_in_flight_lock = threading.Lock()
+
+
+def process_task(plugin: TodoistPlugin, task_id: str):
+    """Run the full create/feedback/cleanup pipeline for one task ID
+
+    Concurrent calls for the same task ID are collapsed: the first one
+    runs the pipeline, the rest block until it finishes and return (or
+    re-raise) its outcome.
+    """
+    with _in_flight_lock:
+        entry = _in_flight.get(task_id)
+        is_owner = entry is None
+        if is_owner:
+            entry = {'done': threading.Event()}
+            _in_flight[task_id] = entry
+
+    if not is_owner:
+        entry['done'].wait()
+        if 'error' in entry:
+            raise entry['error']
+        return entry['result']
+
+    try:
+        task_data = plugin.api.get_task(task_id)
+        task = plugin._convert_to_external_task(task_data)
+        work_effort = plugin.create_work_effort(task)
+        plugin.post_feedback(task, work_effort)
+        plugin.cleanup(task)
+        entry['result'] = work_effort
+        return work_effort
+    except Exception as e:
+        entry['error'] = e
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(task_id, None)
+        entry['done'].set()
+
+
+def handle_client(conn: socket.socket, plugin: TodoistPlugin):
+    """Serve one client connection, one task ID per line"""
+    with conn, conn.makefile('rw') as stream:
+        for line in stream:
+            task_id = line.strip()
+            if not task_id:
+                continue
+            try:
+                work_effort = process_task(plugin, task_id)
+                stream.write(f"OK {work_effort.we_id}\n")
+            except Exception as e:
+                stream.write(f"ERR {e}\n")
+            stream.flush()
+
+
+def serve(config: dict, socket_path: str = SOCKET_PATH):
+    """Bind the socket and dispatch connections to worker threads"""
+    plugin = TodoistPlugin(config)
+    plugin.validate_config()
+
+    try:
+        os.unlink(socket_path)
+    except OSError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(f"✓ Todoist daemon listening on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(
+                target=handle_client, args=(conn, plugin), daemon=True
+            ).start()
+    finally:
+        server.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+
+def send(task_id: str, socket_path: str = SOCKET_PATH) -> str:
+    """Send one task ID to a running daemon and return its reply line"""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(socket_path)
+    with client, client.makefile('rw') as stream:
+        stream.write(f"{task_id}\n")
+        stream.flush()
+        return stream.readline().strip()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Process Todoist task IDs over a UNIX socket',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        '--config',
+        help='Path to JSON config file',
+        type=str
+    )
+
+    parser.add_argument(
+        '--socket',
+        help=f'UNIX socket path (default: {SOCKET_PATH})',
+        type=str,
+        default=SOCKET_PATH
+    )
+
+    parser.add_argument(
+        '--send',
+        help='Send a task ID to a running daemon and exit',
+        type=str
+    )
+
+    args = parser.parse_args()
+
+    if args.send:
+        try:
+            print(send(args.send, args.socket))
+        except OSError as e:
+            print(f"✗ Could not reach daemon: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    try:
+        config = load_config(args.config)
+    except Exception as e:
+        print(f"✗ Failed to load config: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    if 'api_token' not in config or not config['api_token']:
+        print("✗ Error: TODOIST_API_TOKEN not set", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        serve(config, args.socket)
+    except KeyboardInterrupt:
+        print("\n✓ Stopped by user")
+        sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,7 +15,6 @@ from plugins.helpers import (
     sanitize_title,
     validate_folder_name,
     create_work_effort_structure,
-    format_index_file,
     find_work_effort_by_id,
     generate_ticket_id,
     create_ticket_file
@@ -24,7 +23,102 @@ from plugins.todoist.api import TodoistAPI, TodoistAPIError
 from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import queue
 import re
+import sys
+import threading
+import time
+
+# From 3.11 fromisoformat accepts a trailing 'Z' directly, so the
+# per-timestamp string copy from .replace() is only needed on 3.10.
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Compiled once at import: WE-ID references (WE-YYMMDD-xxxx) and
+# markdown checklist items.  These run per task / per description line,
+# so recompiling (or re-fetching from re's internal cache) in the loop
+# is wasted work.
+_WE_ID_RE = re.compile(r'WE-\d{6}-[a-z0-9]{4}', re.IGNORECASE)
+# MULTILINE so one finditer pass covers the whole description; [ \t]
+# instead of \s keeps each match confined to a single line.
+_CHECKLIST_RE = re.compile(r'^[ \t]*-[ \t]*\[[ xX]\][ \t]*(.+)$', re.MULTILINE)
+
+# Static tail of every feedback comment; built once instead of per message.
+_FEEDBACK_FOOTER = "\nYou can now track progress in the _pyrite system!\n"
+
+
+def _count_tickets(tickets_dir: Path) -> int:
+    """
+    Count TKT-*.md entries in a tickets directory
+
+    os.scandir reads the directory with batched getdents calls and the
+    name checks run on plain strings, so no Path object is built per
+    entry just to be counted.
+    """
+    with os.scandir(tickets_dir) as entries:
+        return sum(
+            1 for e in entries
+            if e.name.startswith('TKT-') and e.name.endswith('.md')
+        )
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse a Todoist ISO-8601 timestamp (possibly 'Z'-suffixed)"""
+    if _FROMISO_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _format_index_fast(
+    we_id: str,
+    title: str,
+    description: Optional[str],
+    source: str,
+    source_url: str,
+    labels: list,
+    created: Optional[datetime]
+) -> str:
+    """
+    Index-file fast path specialized for Todoist tasks
+
+    Todoist always supplies source and source_url, so those fields are
+    inlined into one f-string instead of going through the generic
+    format_index_file branching.  Output is identical to the generic
+    builder for this field combination.
+    """
+    created_iso = (created or datetime.now()).isoformat()
+    labels_line = f"labels: {labels}\n" if labels else ""
+    desc_block = f"## Description\n\n{description}\n\n" if description else ""
+    labels_row = f"- **Labels**: {', '.join(labels)}\n" if labels else ""
+
+    return f"""---
+id: {we_id}
+title: "{title}"
+status: in_progress
+created: {created_iso}
+source: {source}
+source_url: {source_url}
+{labels_line}---
+
+# {title}
+
+{desc_block}## Source Task
+
+- **Service**: {source}
+- **URL**: {source_url}
+{labels_row}
+## Progress
+
+- Work effort created
+- Ready for implementation
+
+## Next Steps
+
+1. Review task requirements
+2. Create tickets in `tickets/` directory
+3. Begin implementation
+"""
 
 
 class TodoistPlugin(BasePlugin):
@@ -52,6 +146,10 @@ class TodoistPlugin(BasePlugin):
         ...     plugin.cleanup(task)
     """
 
+    # How long a successful validate_config result is trusted before the
+    # token is re-checked against the API.
+    VALIDATION_TTL = 300.0
+
     @property
     def name(self) -> str:
         """Return plugin name"""
@@ -70,11 +168,21 @@ class TodoistPlugin(BasePlugin):
         self.config.setdefault('trigger_label', 'pyrite')
         self.config.setdefault('work_efforts_dir', '_work_efforts')
 
+        # Path construction goes through flavour dispatch and parsing;
+        # build the base path once instead of per create/find call.
+        self._base_path = Path(self.config['work_efforts_dir'])
+
         # Initialize API client
         self.api = None
         if 'api_token' in config:
             self.api = TodoistAPI(config['api_token'])
 
+        # Snapshot of the config as of the last successful validation;
+        # lets repeated validate_config calls skip the network check
+        # until VALIDATION_TTL elapses.
+        self._validated_config = None
+        self._validated_at = 0.0
+
     def validate_config(self) -> bool:
         """
         Validate plugin configuration
@@ -85,6 +193,15 @@ class TodoistPlugin(BasePlugin):
         Raises:
             ValueError: If config is missing required fields or invalid
         """
+        # Short-circuit when this exact config validated recently; the
+        # token check below costs a network round-trip.  The TTL bounds
+        # how long a revoked token would go unnoticed in a long-lived
+        # process.
+        config_key = tuple(sorted((k, repr(v)) for k, v in self.config.items()))
+        if (config_key == self._validated_config
+                and time.monotonic() - self._validated_at < self.VALIDATION_TTL):
+            return True
+
         # Check required fields
         if 'api_token' not in self.config:
             raise ValueError("Missing required config: api_token")
@@ -102,6 +219,9 @@ class TodoistPlugin(BasePlugin):
         if not work_efforts_dir:
             raise ValueError("work_efforts_dir cannot be empty")
 
+        # Refresh the cached base path in case config changed after init
+        self._base_path = Path(work_efforts_dir)
+
         # Initialize API if not already done
         if not self.api:
             self.api = TodoistAPI(self.config['api_token'])
@@ -113,6 +233,8 @@ class TodoistPlugin(BasePlugin):
         except TodoistAPIError as e:
             raise ValueError(f"Failed to validate API token: {str(e)}")
 
+        self._validated_config = config_key
+        self._validated_at = time.monotonic()
         return True
 
     def fetch_tasks(self) -> List[ExternalTask]:
@@ -144,6 +266,9 @@ class TodoistPlugin(BasePlugin):
                     'labels': task.labels
                 })
 
+            # No-op unless async_events is on; then it makes sure
+            # listeners saw the whole batch before we return.
+            self.flush_events()
             return tasks
 
         except TodoistAPIError as e:
@@ -153,6 +278,44 @@ class TodoistPlugin(BasePlugin):
             })
             raise
 
+    def iter_fetch_tasks(self):
+        """
+        Stream trigger-labeled tasks as they arrive from Todoist
+
+        Generator counterpart to fetch_tasks: tasks are converted and
+        yielded page by page via the cursor-following iter_tasks, so
+        processing can start before the last page downloads and the raw
+        JSON for the whole account is never held alongside the
+        converted objects.  fetch_tasks keeps its list contract for
+        existing callers.
+
+        Yields:
+            ExternalTask objects
+
+        Raises:
+            TodoistAPIError: If an API request fails mid-stream
+        """
+        trigger_label = self.config['trigger_label']
+
+        try:
+            for task_data in self.api.iter_tasks(label=trigger_label):
+                task = self._convert_to_external_task(task_data)
+
+                self.emit_event('plugin.task.fetched', {
+                    'task_id': task.id,
+                    'title': task.title,
+                    'labels': task.labels
+                })
+
+                yield task
+
+        except TodoistAPIError as e:
+            self.emit_event('plugin.error', {
+                'operation': 'fetch_tasks',
+                'error': str(e)
+            })
+            raise
+
     def create_work_effort(self, task: ExternalTask) -> WorkEffort:
         """
         Create work effort from Todoist task (or link to existing WE)
@@ -173,17 +336,16 @@ class TodoistPlugin(BasePlugin):
             ValueError: If work effort creation fails validation
         """
         try:
-            base_path = Path(self.config['work_efforts_dir'])
+            base_path = self._base_path
             linked_to_existing = False
             created_tickets = []
+            ticket_meta = []
 
             # Phase 4: Check for WE-ID in task title or description
             # Pattern: WE-YYMMDD-xxxx
-            we_id_pattern = r'WE-\d{6}-[a-z0-9]{4}'
-
             # Search in title first, then description
             search_text = f"{task.title}\n{task.description or ''}"
-            we_match = re.search(we_id_pattern, search_text, re.IGNORECASE)
+            we_match = _WE_ID_RE.search(search_text)
 
             if we_match:
                 # Found WE-ID reference - try to link to existing WE
@@ -216,7 +378,7 @@ class TodoistPlugin(BasePlugin):
                     )
 
                     # Create index file
-                    content = format_index_file(
+                    content = _format_index_fast(
                         we_id=we_id,
                         title=task.title,
                         description=task.description,
@@ -225,7 +387,7 @@ class TodoistPlugin(BasePlugin):
                         labels=task.labels,
                         created=task.created
                     )
-                    index_path.write_text(content)
+                    index_path.write_bytes(content.encode('utf-8'))
 
                     # Emit event
                     self.emit_event('plugin.work_effort.created', {
@@ -246,7 +408,7 @@ class TodoistPlugin(BasePlugin):
                 )
 
                 # Create index file
-                content = format_index_file(
+                content = _format_index_fast(
                     we_id=we_id,
                     title=task.title,
                     description=task.description,
@@ -255,7 +417,7 @@ class TodoistPlugin(BasePlugin):
                     labels=task.labels,
                     created=task.created
                 )
-                index_path.write_text(content)
+                index_path.write_bytes(content.encode('utf-8'))
 
                 # Emit event
                 self.emit_event('plugin.work_effort.created', {
@@ -266,17 +428,74 @@ class TodoistPlugin(BasePlugin):
                 })
 
             # Phase 4: Parse subtasks and create tickets
+            # One timestamp shared across the batch: avoids a clock read
+            # per ticket and keeps the tickets' created times consistent.
             subtasks = self.parse_subtasks(task)
-            for subtask_title in subtasks:
-                ticket_path = self.create_ticket(
-                    we_path=folder_path,
-                    we_id=we_id,
-                    title=subtask_title,
-                    description=f"From Todoist task: {task.title}",
-                    source_task_id=task.id,
-                    source_url=task.url
-                )
-                created_tickets.append(ticket_path)
+            now = datetime.now()
+            if subtasks:
+                # One mkdir for the batch (linked WEs may lack tickets/),
+                # then count existing tickets once and hand each
+                # create_ticket an explicit sequence number; re-counting
+                # inside the loop would rescan the directory per subtask.
+                tickets_dir.mkdir(exist_ok=True)
+                start = 1 + _count_tickets(tickets_dir)
+                ticket_desc = f"From Todoist task: {task.title}"
+
+                if len(subtasks) >= 4:
+                    # Enough files that overlapping the independent
+                    # writes pays for a small pool.  Events are emitted
+                    # serially afterwards, in input order, so handlers
+                    # never run concurrently.
+                    def write_one(args):
+                        offset, subtask_title = args
+                        ticket_id = generate_ticket_id(we_id, start + offset)
+                        path = create_ticket_file(
+                            tickets_dir=tickets_dir,
+                            ticket_id=ticket_id,
+                            title=subtask_title,
+                            description=ticket_desc,
+                            source_task_id=task.id,
+                            source_url=task.url,
+                            labels=['todoist'],
+                            created=now
+                        )
+                        return ticket_id, subtask_title, path
+
+                    with ThreadPoolExecutor(max_workers=4) as pool:
+                        results = list(pool.map(write_one, enumerate(subtasks)))
+
+                    for ticket_id, subtask_title, ticket_path in results:
+                        self.emit_event('plugin.ticket.created', {
+                            'ticket_id': ticket_id,
+                            'title': subtask_title,
+                            'we_id': we_id,
+                            'path': str(ticket_path)
+                        })
+                        created_tickets.append(ticket_path)
+                        ticket_meta.append((ticket_id, subtask_title))
+                else:
+                    for offset, subtask_title in enumerate(subtasks):
+                        ticket_path = self.create_ticket(
+                            we_path=folder_path,
+                            we_id=we_id,
+                            tickets_dir=tickets_dir,
+                            title=subtask_title,
+                            description=ticket_desc,
+                            source_task_id=task.id,
+                            source_url=task.url,
+                            created=now,
+                            sequence=start + offset
+                        )
+                        created_tickets.append(ticket_path)
+                        ticket_meta.append(
+                            (generate_ticket_id(we_id, start + offset),
+                             subtask_title)
+                        )
+
+            # Optional durability barrier: one batch of fsyncs after the
+            # whole tree is laid out, instead of a journal flush per file.
+            if self.config.get('durable_writes', False):
+                self._sync_to_disk(folder_path, index_path, created_tickets)
 
             # Create WorkEffort object with Phase 4 enhancements
             work_effort = WorkEffort(
@@ -286,7 +505,8 @@ class TodoistPlugin(BasePlugin):
                 tickets_dir=tickets_dir,
                 source_task=task,
                 created_tickets=created_tickets,
-                linked_to_existing=linked_to_existing
+                linked_to_existing=linked_to_existing,
+                ticket_meta=ticket_meta
             )
 
             return work_effort
@@ -365,6 +585,155 @@ class TodoistPlugin(BasePlugin):
             })
             return False
 
+    @staticmethod
+    def _sync_to_disk(folder_path: Path, index_path: Path,
+                      created_tickets: List[Path]):
+        """
+        Flush a freshly written work effort tree to stable storage
+
+        All files are written with ordinary buffered I/O first; this
+        then fsyncs each file and, once, each containing directory, so
+        a K-ticket work effort pays one batched set of flushes at the
+        end rather than a durability barrier per write.
+        """
+        dir_flag = getattr(os, 'O_DIRECTORY', 0)
+
+        for path in (index_path, *created_tickets):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+        for dir_path in {folder_path, *(p.parent for p in created_tickets)}:
+            fd = os.open(dir_path, os.O_RDONLY | dir_flag)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def process_tasks(self, tasks: List[ExternalTask]) -> List[WorkEffort]:
+        """
+        Process a batch of tasks with parallel feedback/cleanup
+
+        create_work_effort runs serially — it is local disk work and
+        shares the ticket-sequence state — then the per-task Todoist
+        round-trips (comment POST, label removal) overlap on a thread
+        pool, so a batch costs roughly one request latency instead of 2N.
+
+        Events emitted from worker threads are routed through a queue
+        and delivered to registered handlers from the calling thread,
+        so handlers never run concurrently.
+
+        Args:
+            tasks: Tasks to process (from fetch_tasks)
+
+        Returns:
+            List of created WorkEffort objects, in task order
+        """
+        if not tasks:
+            return []
+
+        pairs = [(task, self.create_work_effort(task)) for task in tasks]
+
+        max_workers = self.config.get('max_workers', 8)
+        # Caps in-flight API calls; keeps bursts well under Todoist's
+        # 450 requests / 15 minutes budget.
+        gate = threading.Semaphore(max_workers)
+
+        pending_events = queue.Queue()
+        real_handlers = self.event_handlers
+        self.event_handlers = [pending_events.put]
+
+        def gated(fn, *args):
+            with gate:
+                return fn(*args)
+
+        def drain():
+            while True:
+                try:
+                    event = pending_events.get_nowait()
+                except queue.Empty:
+                    return
+                for handler in real_handlers:
+                    handler(event)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(gated, fn, *args)
+                    for task, we in pairs
+                    for fn, args in ((self.post_feedback, (task, we)),
+                                     (self.cleanup, (task,)))
+                ]
+                for future in as_completed(futures):
+                    future.result()
+                    drain()
+        finally:
+            self.event_handlers = real_handlers
+            drain()
+
+        self.flush_events()
+        return [we for _, we in pairs]
+
+    def flush(self, tasks: List[ExternalTask],
+              work_efforts: List[WorkEffort]) -> bool:
+        """
+        Post feedback and remove trigger labels for a batch in one request
+
+        Batched alternative to calling post_feedback + cleanup per task:
+        accumulates note_add and item_update Sync API commands for every
+        processed task and ships them in a single sync_commands call, so
+        a run with N tasks costs one round-trip instead of 2N.
+
+        Args:
+            tasks: Processed Todoist tasks
+            work_efforts: Work efforts created for them, in the same order
+
+        Returns:
+            True if the whole batch was accepted
+        """
+        trigger_label = self.config['trigger_label']
+
+        commands = []
+        for task, work_effort in zip(tasks, work_efforts):
+            commands.append({
+                'type': 'note_add',
+                'args': {
+                    'item_id': task.id,
+                    'content': self._format_feedback_message(work_effort)
+                }
+            })
+            commands.append({
+                'type': 'item_update',
+                'args': {
+                    'id': task.id,
+                    'labels': [l for l in task.labels if l != trigger_label]
+                }
+            })
+
+        try:
+            self.api.sync_commands(commands)
+        except TodoistAPIError as e:
+            self.emit_event('plugin.error', {
+                'operation': 'flush',
+                'error': str(e)
+            })
+            return False
+
+        # Network I/O is done; per-task events still fire for dashboards.
+        for task, work_effort in zip(tasks, work_efforts):
+            self.emit_event('plugin.feedback.posted', {
+                'task_id': task.id,
+                'we_id': work_effort.we_id
+            })
+            self.emit_event('plugin.cleanup.completed', {
+                'task_id': task.id,
+                'label_removed': trigger_label
+            })
+
+        return True
+
     # Phase 4: WE Lookup and Subtask Methods
 
     def find_work_effort(self, we_id: str) -> Optional[Path]:
@@ -377,8 +746,7 @@ class TodoistPlugin(BasePlugin):
         Returns:
             Path to work effort folder if found, None otherwise
         """
-        base_path = Path(self.config['work_efforts_dir'])
-        return find_work_effort_by_id(base_path, we_id)
+        return find_work_effort_by_id(self._base_path, we_id)
 
     def parse_subtasks(self, task: ExternalTask) -> List[str]:
         """
@@ -397,16 +765,15 @@ class TodoistPlugin(BasePlugin):
         if not task.description:
             return []
 
+        # Match markdown checklist: - [ ] Title or - [x] Title.
+        # One multiline finditer scan over the whole description — the
+        # regex engine skips non-matching lines in C, with no split('\n')
+        # list materialized.
         subtasks = []
-        lines = task.description.split('\n')
-
-        for line in lines:
-            # Match markdown checklist: - [ ] Title or - [x] Title
-            match = re.match(r'^\s*-\s*\[[ xX]\]\s*(.+)$', line.strip())
-            if match:
-                subtask_title = match.group(1).strip()
-                if subtask_title:
-                    subtasks.append(subtask_title)
+        for match in _CHECKLIST_RE.finditer(task.description):
+            subtask_title = match.group(1).strip()
+            if subtask_title:
+                subtasks.append(subtask_title)
 
         return subtasks
 
@@ -417,7 +784,10 @@ class TodoistPlugin(BasePlugin):
         title: str,
         description: str = "",
         source_task_id: str = None,
-        source_url: str = None
+        source_url: str = None,
+        created: Optional[datetime] = None,
+        sequence: Optional[int] = None,
+        tickets_dir: Optional[Path] = None
     ) -> Path:
         """
         Create a ticket file in the work effort's tickets directory
@@ -429,16 +799,22 @@ class TodoistPlugin(BasePlugin):
             description: Ticket description (optional)
             source_task_id: Todoist task ID (optional)
             source_url: URL to Todoist task (optional)
+            created: Shared creation timestamp for batch creation (optional)
+            sequence: Pre-computed sequence number; batch callers count
+                existing tickets once instead of per ticket (optional)
+            tickets_dir: Existing tickets directory; batch callers pass
+                it to skip the per-ticket Path build and mkdir (optional)
 
         Returns:
             Path to created ticket file
         """
-        tickets_dir = we_path / "tickets"
-        tickets_dir.mkdir(exist_ok=True)
+        if tickets_dir is None:
+            tickets_dir = we_path / "tickets"
+            tickets_dir.mkdir(exist_ok=True)
 
-        # Count existing tickets to determine sequence number
-        existing_tickets = list(tickets_dir.glob('TKT-*.md'))
-        sequence = len(existing_tickets) + 1
+        if sequence is None:
+            # Standalone call: count existing tickets to determine it
+            sequence = _count_tickets(tickets_dir) + 1
 
         # Generate ticket ID
         ticket_id = generate_ticket_id(we_id, sequence)
@@ -451,7 +827,8 @@ class TodoistPlugin(BasePlugin):
             description=description,
             source_task_id=source_task_id,
             source_url=source_url,
-            labels=['todoist']
+            labels=['todoist'],
+            created=created
         )
 
         # Emit event
@@ -477,15 +854,16 @@ class TodoistPlugin(BasePlugin):
             ExternalTask object
         """
         # Parse created date
-        created = datetime.fromisoformat(task_data['created_at'].replace('Z', '+00:00'))
+        created = _parse_iso(task_data['created_at'])
 
-        # Parse due date if present
+        # Parse due date if present (single lookup for the due dict)
+        due = task_data.get('due') or {}
         due_date = None
-        if task_data.get('due') and task_data['due'].get('datetime'):
-            due_date = datetime.fromisoformat(task_data['due']['datetime'].replace('Z', '+00:00'))
-        elif task_data.get('due') and task_data['due'].get('date'):
+        if due.get('datetime'):
+            due_date = _parse_iso(due['datetime'])
+        elif due.get('date'):
             # Date only (no time)
-            due_date = datetime.fromisoformat(task_data['due']['date'] + 'T00:00:00')
+            due_date = datetime.fromisoformat(due['date'] + 'T00:00:00')
 
         # Task URL
         task_url = task_data.get('url', f"https://todoist.com/showTask?id={task_data['id']}")
@@ -517,25 +895,34 @@ class TodoistPlugin(BasePlugin):
         else:
             header = f"✅ **Work Effort Created: {work_effort.we_id}**"
 
-        message = f"""{header}
+        # Collect fragments and join once; += on a string reallocates the
+        # whole message per ticket line.
+        parts = [f"""{header}
 
 📁 **Folder**: `{work_effort.folder_path.name}`
 📋 **Index**: `{work_effort.index_path.name}`
-"""
+"""]
 
         # Add ticket information if any were created
         if work_effort.created_tickets:
-            message += f"\n🎫 **Tickets Created** ({len(work_effort.created_tickets)}):\n"
-            for ticket_path in work_effort.created_tickets:
-                ticket_name = ticket_path.stem  # Filename without .md extension
-                # Extract ticket ID and title from filename (TKT-xxxx-NNN_title)
-                parts = ticket_name.split('_', 1)
-                ticket_id = parts[0] if parts else ticket_name
-                ticket_title = parts[1].replace('_', ' ').title() if len(parts) > 1 else ''
-                message += f"- `{ticket_id}`: {ticket_title}\n"
+            parts.append(f"\n🎫 **Tickets Created** ({len(work_effort.created_tickets)}):\n")
+            if len(work_effort.ticket_meta) == len(work_effort.created_tickets):
+                # IDs and original titles were recorded at creation time;
+                # no lossy round-trip through the sanitized filename.
+                for ticket_id, ticket_title in work_effort.ticket_meta:
+                    parts.append(f"- `{ticket_id}`: {ticket_title}\n")
+            else:
+                # WorkEffort built elsewhere: reconstruct from filenames
+                for ticket_path in work_effort.created_tickets:
+                    ticket_name = ticket_path.stem  # Filename without .md extension
+                    # Extract ticket ID and title from filename (TKT-xxxx-NNN_title)
+                    name_parts = ticket_name.split('_', 1)
+                    ticket_id = name_parts[0] if name_parts else ticket_name
+                    ticket_title = name_parts[1].replace('_', ' ').title() if len(name_parts) > 1 else ''
+                    parts.append(f"- `{ticket_id}`: {ticket_title}\n")
         else:
-            message += f"\n🎫 **Tickets**: `{work_effort.tickets_dir.name}/` (ready for tickets)\n"
+            parts.append(f"\n🎫 **Tickets**: `{work_effort.tickets_dir.name}/` (ready for tickets)\n")
 
-        message += "\nYou can now track progress in the _pyrite system!\n"
+        parts.append(_FEEDBACK_FOOTER)
 
-        return message
+        return ''.join(parts)
@@ -21,16 +21,23 @@ Configuration:
         "api_token": "your-todoist-token",
         "trigger_label": "pyrite",
         "work_efforts_dir": "_work_efforts",
-        "poll_interval": 300
+        "poll_interval": 300,
+        "max_poll_interval": 3600
     }
 """
 
+import copy
 import os
 import sys
 import json
 import time
 import argparse
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime
 
 # Add project root to path
@@ -40,6 +47,12 @@ from plugins.todoist import TodoistPlugin
 from plugins.todoist.api import TodoistAPIError
 
 
+# Parsed config files keyed by resolved path, validated against the
+# file's mtime; repeated loads (supervisor restarts, future SIGHUP
+# reload) skip the re-read and re-parse when nothing changed.
+_CONFIG_CACHE: dict = {}
+
+
 def load_config(config_path: str = None) -> dict:
     """
     Load configuration from file or environment
@@ -54,8 +67,19 @@ def load_config(config_path: str = None) -> dict:
 
     # Load from file if provided
     if config_path and Path(config_path).exists():
-        with open(config_path) as f:
-            config = json.load(f)
+        path = Path(config_path).resolve()
+        mtime = os.stat(path).st_mtime_ns
+
+        key = str(path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is None or cached[0] != mtime:
+            data = path.read_bytes()
+            parsed = orjson.loads(data) if orjson is not None else json.loads(data)
+            _CONFIG_CACHE[key] = cached = (mtime, parsed)
+
+        # Deep copy so env overrides and setdefaults below never touch
+        # the cached object.
+        config = copy.deepcopy(cached[1])
 
     # Override with environment variables
     if 'TODOIST_API_TOKEN' in os.environ:
@@ -68,17 +92,21 @@ def load_config(config_path: str = None) -> dict:
     config.setdefault('trigger_label', 'pyrite')
     config.setdefault('work_efforts_dir', '_work_efforts')
     config.setdefault('poll_interval', 300)
+    config.setdefault('max_poll_interval', 3600)
 
     return config
 
 
-def process_tasks(plugin: TodoistPlugin, verbose: bool = True):
+def process_tasks(plugin: TodoistPlugin, verbose: bool = True,
+                  raise_api_errors: bool = False):
     """
     Fetch and process all tasks with trigger label
 
     Args:
         plugin: Initialized TodoistPlugin
         verbose: Print detailed output
+        raise_api_errors: Re-raise TodoistAPIError instead of swallowing
+            it, so the caller can react (e.g. honor Retry-After)
 
     Returns:
         Number of tasks processed
@@ -93,8 +121,13 @@ def process_tasks(plugin: TodoistPlugin, verbose: bool = True):
             else:
                 print("✓ No tasks to process")
 
-        # Process each task
+        # Work efforts are created locally first; the remote side
+        # effects (feedback comments, label removal) then ship as a
+        # single batched Sync API call via plugin.flush, so a k-task
+        # cycle costs one round-trip instead of 2k.
         processed = 0
+        done_tasks = []
+        done_efforts = []
         for task in tasks:
             try:
                 if verbose:
@@ -108,28 +141,23 @@ def process_tasks(plugin: TodoistPlugin, verbose: bool = True):
                 if verbose:
                     print(f"✓ Created: {work_effort.folder_path.name}")
 
-                # Post feedback
-                feedback_success = plugin.post_feedback(task, work_effort)
-                if verbose:
-                    if feedback_success:
-                        print(f"✓ Posted feedback to Todoist")
-                    else:
-                        print(f"⚠ Failed to post feedback")
-
-                # Cleanup (remove label)
-                cleanup_success = plugin.cleanup(task)
-                if verbose:
-                    if cleanup_success:
-                        print(f"✓ Removed '{plugin.config['trigger_label']}' label")
-                    else:
-                        print(f"⚠ Failed to remove label")
-
+                done_tasks.append(task)
+                done_efforts.append(work_effort)
                 processed += 1
 
             except Exception as e:
                 if verbose:
                     print(f"✗ Error processing task {task.id}: {str(e)}")
-                continue
+
+        if done_tasks:
+            flushed = plugin.flush(done_tasks, done_efforts)
+            if verbose:
+                if flushed:
+                    print(f"\n✓ Posted feedback and removed "
+                          f"'{plugin.config['trigger_label']}' labels "
+                          f"({len(done_tasks)} task(s), one request)")
+                else:
+                    print(f"\n⚠ Failed to post feedback/remove labels")
 
         if verbose and processed > 0:
             print(f"\n{'='*60}")
@@ -138,6 +166,8 @@ def process_tasks(plugin: TodoistPlugin, verbose: bool = True):
         return processed
 
     except TodoistAPIError as e:
+        if raise_api_errors:
+            raise
         if verbose:
             print(f"✗ API Error: {str(e)}")
         return 0
@@ -219,7 +249,7 @@ def main():
     # Add event handler for monitoring
     def log_event(event):
         if not args.quiet and event['type'] == 'plugin.error':
-            timestamp = datetime.fromisoformat(event['timestamp']).strftime('%H:%M:%S')
+            timestamp = datetime.fromisoformat(str(event['timestamp'])).strftime('%H:%M:%S')
             print(f"[{timestamp}] Error: {event['data']}")
 
     plugin.on_event(log_event)
@@ -242,17 +272,43 @@ def main():
                 print(f"Press Ctrl+C to stop")
                 print(f"{'='*60}\n")
 
+            # Adaptive polling: idle cycles double the interval (capped
+            # at max_poll_interval) so a quiet account stops burning the
+            # API quota; any processed task resets it to the base.
+            base_interval = config['poll_interval']
+            max_interval = config['max_poll_interval']
+            current_interval = base_interval
+
             while True:
                 if not args.quiet:
                     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                     print(f"\n[{timestamp}] Checking for tasks...")
 
-                process_tasks(plugin, verbose=not args.quiet)
+                try:
+                    processed = process_tasks(
+                        plugin, verbose=not args.quiet, raise_api_errors=True
+                    )
+                except TodoistAPIError as e:
+                    if not args.quiet:
+                        print(f"✗ API Error: {str(e)}")
+                    if e.status_code == 429 and e.retry_after:
+                        # The server said when to come back; honor it
+                        # instead of the computed interval.
+                        if not args.quiet:
+                            print(f"Rate limited; retrying in {e.retry_after:.0f} seconds...")
+                        time.sleep(e.retry_after)
+                        continue
+                    processed = 0
+
+                if processed:
+                    current_interval = base_interval
+                else:
+                    current_interval = min(max_interval, current_interval * 2)
 
                 if not args.quiet:
-                    print(f"Sleeping for {config['poll_interval']} seconds...")
+                    print(f"Sleeping for {current_interval} seconds...")
 
-                time.sleep(config['poll_interval'])
+                time.sleep(current_interval)
 
     except KeyboardInterrupt:
         if not args.quiet:
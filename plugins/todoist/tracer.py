@@ -9,13 +9,19 @@ there's no spaghetti code - we can trace every step.
 """
 
 import json
+import os
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+# How many completed traces the tracer retains in memory; the oldest
+# fall off automatically once the buffer is full.
+TRACE_BUFFER = int(os.environ.get('PYRITE_TRACE_BUFFER', 1000))
+
 
 class TraceLevel(Enum):
     """Trace event levels"""
@@ -26,7 +32,9 @@ class TraceLevel(Enum):
     SUCCESS = "SUCCESS"
 
 
-@dataclass
+# slots=True: traces hold dozens of events apiece, and dropping the
+# per-instance __dict__ roughly halves each event's footprint.
+@dataclass(slots=True)
 class TraceEvent:
     """A single trace event in the request lifecycle"""
     timestamp: str
@@ -179,7 +187,10 @@ class RequestTracer:
 
     def __init__(self):
         self.active_traces: Dict[str, RequestTrace] = {}
-        self.completed_traces: List[RequestTrace] = []
+        # Bounded: a long-running poller completes traces indefinitely,
+        # and an unbounded list would pin every event of every trace for
+        # the life of the process.
+        self.completed_traces: Deque[RequestTrace] = deque(maxlen=TRACE_BUFFER)
 
     def start_trace(self, task_id: str, metadata: Dict[str, Any] = None) -> RequestTrace:
         """Start a new request trace"""
@@ -229,7 +240,7 @@ class RequestTracer:
 
     def get_all_traces(self) -> List[RequestTrace]:
         """Get all traces (active and completed)"""
-        return list(self.active_traces.values()) + self.completed_traces
+        return list(self.active_traces.values()) + list(self.completed_traces)
 
     def print_summary(self):
         """Print summary of all traces"""